@@ -3,18 +3,185 @@ import os
 import re
 import pandas as pd
 import csv
+import threading
 from datetime import datetime, timedelta
+from functools import lru_cache
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QComboBox, QTreeView, QTableView, QVBoxLayout,
     QHBoxLayout, QWidget, QPushButton, QFileDialog, QMessageBox, QSlider,
     QLabel, QSplitter, QMenu, QGridLayout, QScrollArea, QLineEdit, QStyledItemDelegate, QSizePolicy
 )
 from PySide6.QtGui import QStandardItemModel, QStandardItem, QBrush, QColor, QAction, QFontMetrics, QPainter
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import (
+    Qt, QSize, QAbstractItemModel, QModelIndex, QObject, QRunnable, QThread, QThreadPool, QTimer, Signal
+)
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backend_bases import MouseButton
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+
+EVENT_FIELD_PATTERNS = {
+    "account_name": re.compile(r"Account Name:\s+([^\n]+?)\s+Account Domain:", re.DOTALL),
+    "new_pid": re.compile(r"New Process ID:\s+([^\n]+?)\s+New Process Name:", re.DOTALL),
+    "creator_pid": re.compile(r"Creator Process ID:\s+([^\n]+?)\s+Creator Process Name:", re.DOTALL),
+    "full_path": re.compile(r"New Process Name:\s+([^\n]+?)\s+Token Elevation Type:", re.DOTALL),
+    "time_generated": re.compile(r"TimeGenerated=(\d+)"),
+    "cmdline": re.compile(r"Process Command Line:\s+(.+?)(?=\s+Token)", re.DOTALL),
+    "elevation_type": re.compile(r"Token Elevation Type:\s+(.+?)\s+Mandatory Label:", re.DOTALL),
+    "creator_name": re.compile(r"Creator Process Name:\s+([^\n]+?)\s+Process Command Line:", re.DOTALL)
+}
+
+EVENT_FIELD_LABELS = {
+    "account_name": ("Account Name:", "Account Domain:", False),
+    "new_pid": ("New Process ID:", "New Process Name:", False),
+    "creator_pid": ("Creator Process ID:", "Creator Process Name:", False),
+    "full_path": ("New Process Name:", "Token Elevation Type:", False),
+    "cmdline": ("Process Command Line:", "Token", True),
+    "elevation_type": ("Token Elevation Type:", "Mandatory Label:", True),
+    "creator_name": ("Creator Process Name:", "Process Command Line:", False)
+}
+
+TIME_GENERATED_LABEL = "TimeGenerated="
+
+PROCESS_RECORD_FIELDS = [
+    "account_name", "creator_pid", "process_name", "full_path",
+    "time_generated", "cmdline", "elevation_type", "creator_name"
+]
+
+PROCESS_FRAME_CATEGORIES = {
+    "account_name": "category", "process_name": "category", "elevation_type": "category", "creator_name": "category"
+}
+
+ELEVATED_TYPES = frozenset(["TokenElevationTypeFull (3)", "TokenElevationTypeLimited (2)"])
+
+HOUR_LABELS = np.array([f"{hour:02d}:00" for hour in range(24)], dtype=object)
+
+LOCAL_EPOCH = datetime(1970, 1, 1)
+OFFSET_BUCKET_SECONDS = 86400
+
+EMPTY_PROCESSES_FRAME = pd.DataFrame(
+    {name: pd.Series(dtype=object) for name in ["pid"] + PROCESS_RECORD_FIELDS}
+).astype({"time_generated": np.int64, **PROCESS_FRAME_CATEGORIES}).assign(
+    is_root=pd.Series(dtype=bool), hour_of_day=pd.Series(dtype=np.int64), command_flags=pd.Series(dtype=np.int64)
+)
+
+
+@lru_cache(maxsize=4096)
+def find_match_spans(text, search_text):
+    lower_text = text.lower()
+    search_len = len(search_text)
+    spans = []
+    pos = lower_text.find(search_text)
+    while pos != -1:
+        spans.append((pos, pos + search_len))
+        pos = lower_text.find(search_text, pos + search_len)
+    return tuple(spans)
+
+
+def find_labeled_field(message, start_label, end_label, allow_newlines, pattern):
+    start = message.find(start_label)
+    if start == -1:
+        return None
+    start += len(start_label)
+    end = message.find(end_label, start)
+    if end == -1:
+        return None
+    segment = message[start:end]
+    value = segment.strip()
+    if value and segment[0].isspace() and segment[-1].isspace() and (allow_newlines or "\n" not in value):
+        return value
+    match = pattern.search(message)
+    return match.group(1) if match else None
+
+
+def find_time_generated(message, pattern):
+    start = message.find(TIME_GENERATED_LABEL)
+    if start == -1:
+        return None
+    match = pattern.match(message, start) or pattern.search(message, start + 1)
+    return match.group(1) if match else None
+
+
+def extract_event_fields(messages):
+    columns = {name: [] for name in EVENT_FIELD_PATTERNS}
+    extractors = [
+        (columns[name].append, start_label, end_label, allow_newlines, EVENT_FIELD_PATTERNS[name])
+        for name, (start_label, end_label, allow_newlines) in EVENT_FIELD_LABELS.items()
+    ]
+    append_time = columns["time_generated"].append
+    time_pattern = EVENT_FIELD_PATTERNS["time_generated"]
+    for message in messages.tolist():
+        for append, start_label, end_label, allow_newlines, pattern in extractors:
+            append(find_labeled_field(message, start_label, end_label, allow_newlines, pattern))
+        append_time(find_time_generated(message, time_pattern))
+    return pd.DataFrame(columns, index=messages.index, dtype=object)
+
+
+def read_event_csv(file_path):
+    if pa_csv is not None:
+        try:
+            table = pa_csv.read_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(encoding='utf-8', autogenerate_column_names=True),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True)
+            )
+        except pa.ArrowInvalid:
+            pass
+        else:
+            df = table.to_pandas()
+            df.columns = range(len(df.columns))
+            return df
+    return pd.read_csv(file_path, encoding='utf-8', header=None, quoting=csv.QUOTE_ALL)
+
+
+def elevated_mask(elevation_types):
+    elevated_codes = elevation_types.cat.categories.get_indexer(list(ELEVATED_TYPES))
+    return np.isin(elevation_types.cat.codes.to_numpy(), elevated_codes[elevated_codes >= 0])
+
+
+def local_utc_offset(timestamp):
+    return int((datetime.fromtimestamp(timestamp) - LOCAL_EPOCH).total_seconds()) - timestamp
+
+
+def local_datetimes(timestamps):
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    buckets, bucket_of_row = np.unique(timestamps // OFFSET_BUCKET_SECONDS, return_inverse=True)
+    bucket_starts = (buckets * OFFSET_BUCKET_SECONDS).tolist()
+    start_offsets = np.array([local_utc_offset(start) for start in bucket_starts], dtype=np.int64)
+    end_offsets = np.array(
+        [local_utc_offset(start + OFFSET_BUCKET_SECONDS - 1) for start in bucket_starts], dtype=np.int64
+    )
+    local_seconds = timestamps + start_offsets[bucket_of_row]
+    in_transition = (start_offsets != end_offsets)[bucket_of_row]
+    if in_transition.any():
+        local_seconds[in_transition] = [
+            timestamp + local_utc_offset(timestamp) for timestamp in timestamps[in_transition].tolist()
+        ]
+    return local_seconds.astype("datetime64[s]")
+
+
+font_metrics_by_key = {}
+
+
+@lru_cache(maxsize=65536)
+def cached_horizontal_advance(font_key, text):
+    return font_metrics_by_key[font_key].horizontalAdvance(text)
+
+
+def horizontal_advance(font, text):
+    font_key = font.key()
+    if font_key not in font_metrics_by_key:
+        font_metrics_by_key[font_key] = QFontMetrics(font)
+    return cached_horizontal_advance(font_key, text)
+
 
 class HighlightDelegate(QStyledItemDelegate):
     def __init__(self, parent=None):
@@ -34,9 +201,6 @@ class HighlightDelegate(QStyledItemDelegate):
             super().paint(painter, option, index)
             return
 
-        lower_text = text.lower()
-        search_len = len(self.search_text)
-
         painter.save()
         painter.setFont(option.font)
         x = option.rect.x() + 2
@@ -44,28 +208,22 @@ class HighlightDelegate(QStyledItemDelegate):
         height = option.rect.height()
 
         pos = 0
-        while pos < len(text):
-            match_pos = lower_text.find(self.search_text, pos)
-            if match_pos == -1:
-                remaining_text = text[pos:]
-                painter.drawText(x, y, option.rect.width(), height, Qt.AlignLeft | Qt.AlignVCenter, remaining_text)
-                break
-
-            if match_pos > pos:
-                before_text = text[pos:match_pos]
-                metrics = QFontMetrics(option.font)
-                width = metrics.horizontalAdvance(before_text)
+        for match_start, match_end in find_match_spans(text, self.search_text):
+            if match_start > pos:
+                before_text = text[pos:match_start]
                 painter.drawText(x, y, option.rect.width(), height, Qt.AlignLeft | Qt.AlignVCenter, before_text)
-                x += width
+                x += horizontal_advance(option.font, before_text)
 
-            matched_text = text[match_pos:match_pos + search_len]
-            metrics = QFontMetrics(option.font)
-            match_width = metrics.horizontalAdvance(matched_text)
+            matched_text = text[match_start:match_end]
+            match_width = horizontal_advance(option.font, matched_text)
             painter.fillRect(x, y, match_width, height, QColor(255, 182, 193))
             painter.drawText(x, y, option.rect.width(), height, Qt.AlignLeft | Qt.AlignVCenter, matched_text)
             x += match_width
 
-            pos = match_pos + search_len
+            pos = match_end
+
+        if pos < len(text):
+            painter.drawText(x, y, option.rect.width(), height, Qt.AlignLeft | Qt.AlignVCenter, text[pos:])
 
         painter.restore()
 
@@ -84,9 +242,11 @@ class MatplotlibWidget(QWidget):
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         self.canvas.mpl_connect('button_press_event', self.on_click)
         self.canvas.mpl_connect('button_press_event', self.on_double_click)
+        self.canvas.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.canvas.customContextMenuRequested.connect(self.show_context_menu)
 
     def on_click(self, event):
-        if event.dblclick:
+        if event.dblclick or event.button != MouseButton.LEFT:
             return
         if event.inaxes != self.ax or not self.hours:
             return
@@ -109,6 +269,26 @@ class MatplotlibWidget(QWidget):
         if self.on_hour_selected:
             self.on_hour_selected(None)
 
+    def show_context_menu(self, position):
+        menu = QMenu(self)
+        export_action = QAction("Export Histogram...", self)
+        export_action.setEnabled(bool(self.hours))
+        export_action.triggered.connect(self.export_plot)
+        menu.addAction(export_action)
+        menu.exec(self.canvas.mapToGlobal(position))
+
+    def export_plot(self):
+        if getattr(sys, 'frozen', False):
+            base_path = os.path.dirname(sys.executable)
+        else:
+            base_path = os.getcwd()
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Histogram", os.path.join(base_path, 'process_activity.png'),
+            "PNG Files (*.png);;All Files (*)"
+        )
+        if file_path:
+            self.figure.savefig(file_path)
+
     def update_plot(self, hours, counts):
         self.hours = hours
         self.ax.clear()
@@ -120,17 +300,357 @@ class MatplotlibWidget(QWidget):
         for i, count in enumerate(counts):
             self.ax.text(hours[i], count, str(count), ha='center', va='bottom', fontsize=7)
         self.figure.subplots_adjust(bottom=0.3, top=0.9, left=0.05, right=0.95)
-        self.canvas.draw()
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.getcwd()
-        plt.savefig(os.path.join(base_path, 'process_activity.png'))
+        self.canvas.draw_idle()
 
     def sizeHint(self):
         return QSize(800, 200)
 
 
+class ProcessTreeModel(QAbstractItemModel):
+    ROOT_NODE = 0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.headers = [
+            "Process Name", "Full Path", "Account Name", "PID",
+            "Created Time", "Command Line"
+        ]
+        self.display_columns = ["process_name", "full_path", "account_name", "pid", "time_generated", "cmdline"]
+        self.flagged_paths = set()
+        self.flagged_brush = QBrush(QColor(0, 0, 255))
+        self.elevated_brush = QBrush(QColor(200, 0, 0))
+        self.tooltip_columns = frozenset([1, 5])
+        self.set_processes(EMPTY_PROCESSES_FRAME)
+
+    def set_processes(self, processes_frame):
+        self.beginResetModel()
+        self.columns = {
+            name: processes_frame[name].to_numpy(dtype=object)
+            for name in ["pid", "process_name", "full_path", "account_name", "creator_pid", "cmdline", "elevation_type"]
+        }
+        self.columns["time_generated"] = processes_frame["time_generated"].to_numpy(dtype=np.int64)
+        self.row_of_pid = {pid: row for row, pid in enumerate(self.columns["pid"].tolist())}
+        process_names = self.columns["process_name"]
+        self.rows_by_process_name = pd.Series(process_names).groupby(process_names, sort=False).indices
+        self.elevated_rows = elevated_mask(processes_frame["elevation_type"])
+        self.time_texts = {}
+        self.children = self.children_by_pid()
+        self.account_codes, account_names = pd.factorize(self.columns["account_name"])
+        self.account_code_by_name = {name: code for code, name in enumerate(account_names)}
+        self.build_tree(self.columns["pid"][processes_frame["is_root"].to_numpy(dtype=bool)])
+        self.endResetModel()
+
+    def clear_tree(self):
+        self.node_rows = [-1]
+        self.node_parents = [-1]
+        self.node_positions = [0]
+        self.node_children = [[]]
+
+    def build_tree(self, root_pids):
+        self.clear_tree()
+        node_rows = self.node_rows
+        node_parents = self.node_parents
+        node_positions = self.node_positions
+        node_children = self.node_children
+        row_of_pid = self.row_of_pid
+        children = self.children
+        stack = [(self.ROOT_NODE, pid) for pid in reversed(root_pids)]
+        while stack:
+            parent_node, pid = stack.pop()
+            node = len(node_rows)
+            siblings = node_children[parent_node]
+            node_rows.append(row_of_pid[pid])
+            node_parents.append(parent_node)
+            node_positions.append(len(siblings))
+            node_children.append([])
+            siblings.append(node)
+            child_pids = children.get(pid)
+            if child_pids is not None:
+                stack.extend((node, child_pid) for child_pid in reversed(child_pids))
+        self.node_row_array = np.array(self.node_rows, dtype=np.int64)
+        self.top_level_nodes = np.array(self.node_parents, dtype=np.int64) == self.ROOT_NODE
+        self.node_hidden = np.zeros(len(self.node_rows), dtype=bool)
+
+    def hidden_nodes(self, root_mask, child_mask):
+        rows = self.node_row_array[1:]
+        top_level = self.top_level_nodes[1:]
+        visible = np.where(top_level, root_mask[rows], child_mask[rows])
+        return np.concatenate([[not visible[top_level].any()], ~visible])
+
+    def update_hidden(self, hidden):
+        changed = np.flatnonzero(hidden != self.node_hidden)
+        self.node_hidden = hidden
+        return [(node, bool(hidden[node])) for node in changed.tolist()]
+
+    def node_index(self, node):
+        if node == self.ROOT_NODE:
+            return self.createIndex(0, 0, self.ROOT_NODE)
+        return self.createIndex(self.node_positions[node], 0, node)
+
+    def children_by_pid(self):
+        pids = self.columns["pid"]
+        return {
+            creator_pid: pids[rows]
+            for creator_pid, rows in pd.Series(pids).groupby(self.columns["creator_pid"], sort=False).indices.items()
+        }
+
+    def full_paths_for(self, process_name):
+        rows = self.rows_by_process_name.get(process_name, [])
+        return set(self.columns["full_path"][rows]) - {"Unknown"}
+
+    def display_text(self, node, column):
+        if node == self.ROOT_NODE:
+            return "Root" if column == 0 else None
+        row = self.node_rows[node]
+        if column == 4:
+            time_text = self.time_texts.get(row)
+            if time_text is None:
+                time_text = self.format_time(row)
+                self.time_texts[row] = time_text
+            return time_text
+        return self.columns[self.display_columns[column]][row]
+
+    def format_time(self, row):
+        time_generated = int(self.columns["time_generated"][row])
+        try:
+            return (datetime.fromtimestamp(time_generated).strftime('%Y-%m-%d %H:%M:%S')
+                    if time_generated > 0 else "Unknown")
+        except (OSError, ValueError, TypeError):
+            return "Unknown"
+
+    def index(self, row, column, parent=QModelIndex()):
+        if row < 0 or not 0 <= column < len(self.headers):
+            return QModelIndex()
+        if not parent.isValid():
+            if row == 0 and self.node_children[self.ROOT_NODE]:
+                return self.createIndex(row, column, self.ROOT_NODE)
+            return QModelIndex()
+        if parent.column() != 0:
+            return QModelIndex()
+        children = self.node_children[parent.internalId()]
+        if row >= len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalId()
+        if node == self.ROOT_NODE:
+            return QModelIndex()
+        parent_node = self.node_parents[node]
+        return self.createIndex(self.node_positions[parent_node], 0, parent_node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return 1 if self.node_children[self.ROOT_NODE] else 0
+        if parent.column() != 0:
+            return 0
+        return len(self.node_children[parent.internalId()])
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalId()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self.display_text(node, column)
+        if node == self.ROOT_NODE:
+            return None
+        row = self.node_rows[node]
+        if role == Qt.ToolTipRole and column in self.tooltip_columns:
+            return self.display_text(node, column)
+        if role == Qt.ForegroundRole:
+            if self.columns["full_path"][row] in self.flagged_paths:
+                return self.flagged_brush
+            if self.elevated_rows[row]:
+                return self.elevated_brush
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_nodes = [(index.internalId(), index.column()) for index in old_indexes]
+        for children in self.node_children:
+            children.sort(key=lambda node: self.display_text(node, column) or "",
+                          reverse=order == Qt.DescendingOrder)
+            for position, node in enumerate(children):
+                self.node_positions[node] = position
+        self.changePersistentIndexList(
+            old_indexes, [self.createIndex(self.node_positions[node], col, node) for node, col in old_nodes]
+        )
+        self.layoutChanged.emit()
+
+
+class CommandPatternMatcher:
+    def __init__(self, pattern_families):
+        self.family_count = len(pattern_families)
+        family_bits = {}
+        for bit, patterns in enumerate(pattern_families):
+            for pattern in patterns:
+                family_bits[pattern] = family_bits.get(pattern, 0) | (1 << bit)
+        self.bits_by_pattern = {}
+        for pattern in family_bits:
+            bits = 0
+            for other, other_bits in family_bits.items():
+                if other in pattern:
+                    bits |= other_bits
+            self.bits_by_pattern[pattern] = bits
+        alternation = '|'.join(map(re.escape, sorted(family_bits, key=len, reverse=True)))
+        self.regex = re.compile(f"(?=({alternation}))")
+
+    def match_bits(self, text):
+        bits = 0
+        for pattern in set(self.regex.findall(text)):
+            bits |= self.bits_by_pattern[pattern]
+        return bits
+
+    def flags(self, texts):
+        codes, uniques = pd.factorize(texts)
+        unique_bits = np.array([self.match_bits(text) for text in uniques], dtype=np.int64)
+        return unique_bits[codes]
+
+    def family_counts(self, flags):
+        counts_by_bits = np.bincount(flags, minlength=1 << self.family_count)
+        bit_patterns = np.arange(len(counts_by_bits))
+        return [int(counts_by_bits[(bit_patterns >> bit) & 1 == 1].sum()) for bit in range(self.family_count)]
+
+
+def parse_event_csv(file_path, lotl_binaries, command_matcher):
+    df = read_event_csv(file_path)
+
+    message_col = None
+    for col in df.columns:
+        has_creator_subject = df[col].astype(str).str.contains("Creator Subject", regex=False)
+        if has_creator_subject.any():
+            message_col = col
+            break
+
+    if message_col is None:
+        raise ValueError("No column contains 'Creator Subject' (Message field).")
+
+    messages = df[message_col]
+    messages = messages[has_creator_subject &
+                        messages.str.contains("EventID=4688", regex=False, na=False)]
+
+    fields = extract_event_fields(messages)
+    fields = fields.dropna(subset=["account_name", "new_pid", "creator_pid", "full_path"])
+
+    for name in ["account_name", "new_pid", "creator_pid", "full_path", "elevation_type", "creator_name"]:
+        fields[name] = fields[name].str.strip()
+    fields["process_name"] = fields["full_path"].str.rsplit("\\", n=1).str[-1]
+    fields.loc[fields["full_path"] == "", ["process_name", "full_path"]] = "Unknown"
+    fields["cmdline"] = fields["cmdline"].str.strip().str.lower().fillna("Unknown")
+    fields["elevation_type"] = fields["elevation_type"].fillna("Unknown")
+    fields["creator_name"] = fields["creator_name"].fillna("Unknown")
+
+    times = pd.to_numeric(fields["time_generated"], errors="coerce").fillna(0).to_numpy()
+    times = np.where((times > 0) & (times <= 2147483647), times, 0).astype(np.int64)
+    fields["time_generated"] = times
+    valid_times = times[times > 0]
+    if valid_times.size > 0:
+        min_time = int(valid_times.min())
+        max_time = int(valid_times.max())
+    else:
+        min_time = int(datetime(2025, 5, 14).timestamp())
+        max_time = int(datetime(2025, 5, 14, 23, 59, 59).timestamp())
+
+    fields = fields[(fields["account_name"] != "") & (fields["account_name"] != "-")]
+
+    last_records = ~fields["new_pid"].duplicated(keep="last").to_numpy()
+    processes_frame = fields.loc[last_records, ["new_pid"] + PROCESS_RECORD_FIELDS].set_index("new_pid")
+    processes_frame = processes_frame.reindex(pd.unique(fields["new_pid"])).rename_axis("pid").reset_index()
+    processes_frame = processes_frame.astype(PROCESS_FRAME_CATEGORIES)
+    processes_frame["is_root"] = ~processes_frame["creator_pid"].isin(processes_frame["pid"]).to_numpy()
+    local_seconds = local_datetimes(processes_frame["time_generated"].to_numpy()).astype(np.int64)
+    processes_frame["hour_of_day"] = local_seconds // 3600 % 24
+    processes_frame["command_flags"] = command_matcher.flags(processes_frame["cmdline"])
+
+    process_names = fields["process_name"].astype("category")
+    category_in_lotl = np.array(
+        [name.lower() in lotl_binaries for name in process_names.cat.categories], dtype=bool
+    )
+    lotl_mask = category_in_lotl[process_names.cat.codes.to_numpy()] & last_records
+
+    return {
+        "processes_frame": processes_frame,
+        "usernames": set(fields["account_name"]),
+        "flagged_paths": set(fields.loc[lotl_mask, "full_path"].unique()),
+        "min_time": min_time,
+        "max_time": max_time
+    }
+
+
+def summarize_processes(processes_frame, mask, flagged_paths, command_matcher):
+    filtered = processes_frame[mask]
+    app_counts = filtered["process_name"].value_counts(sort=False).sort_index()
+    flagged_rows = processes_frame["full_path"].isin(flagged_paths)
+    suspicious_commands, network_commands, registry_commands = command_matcher.family_counts(
+        filtered["command_flags"].to_numpy()
+    )
+    return {
+        "total_processes": len(filtered),
+        "app_counts": app_counts[app_counts > 0],
+        "flagged_apps": set(processes_frame.loc[flagged_rows, "process_name"]),
+        "unique_users": filtered["account_name"].nunique(),
+        "elevated_processes": int(elevated_mask(filtered["elevation_type"]).sum()),
+        "parent_processes": filtered["creator_name"].nunique(),
+        "suspicious_commands": suspicious_commands,
+        "network_commands": network_commands,
+        "registry_commands": registry_commands
+    }
+
+
+class CsvParseWorker(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+
+    def __init__(self, file_path, lotl_binaries, command_matcher):
+        super().__init__()
+        self.file_path = file_path
+        self.lotl_binaries = lotl_binaries
+        self.command_matcher = command_matcher
+
+    def run(self):
+        try:
+            parsed = parse_event_csv(self.file_path, self.lotl_binaries, self.command_matcher)
+        except Exception as e:
+            self.failed.emit(e)
+            return
+        self.finished.emit(parsed)
+
+
+class FilterStatsSignals(QObject):
+    finished = Signal(int, object)
+
+
+class FilterStatsWorker(QRunnable):
+    def __init__(self, signals, generation, cancelled, processes_frame, mask, flagged_paths, command_matcher):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.cancelled = cancelled
+        self.processes_frame = processes_frame
+        self.mask = mask
+        self.flagged_paths = flagged_paths
+        self.command_matcher = command_matcher
+
+    def run(self):
+        if self.cancelled.is_set():
+            return
+        stats = summarize_processes(self.processes_frame, self.mask, self.flagged_paths, self.command_matcher)
+        if not self.cancelled.is_set():
+            self.signals.finished.emit(self.generation, stats)
+
+
 class ProcessTreeWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -172,6 +692,11 @@ class ProcessTreeWindow(QMainWindow):
 
         time_filter_layout.addLayout(labels_layout)
 
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(120)
+        self.filter_timer.timeout.connect(self.filter_tree)
+
         sliders_layout = QHBoxLayout()
         sliders_layout.setSpacing(3)
         self.start_slider = QSlider(Qt.Horizontal)
@@ -180,6 +705,7 @@ class ProcessTreeWindow(QMainWindow):
         self.start_slider.setMaximum(100)
         self.start_slider.setEnabled(False)
         self.start_slider.valueChanged.connect(self.update_time_labels)
+        self.start_slider.sliderReleased.connect(self.flush_pending_filter)
         sliders_layout.addWidget(self.start_slider)
 
         self.end_slider = QSlider(Qt.Horizontal)
@@ -188,6 +714,7 @@ class ProcessTreeWindow(QMainWindow):
         self.end_slider.setMaximum(100)
         self.end_slider.setEnabled(False)
         self.end_slider.valueChanged.connect(self.update_time_labels)
+        self.end_slider.sliderReleased.connect(self.flush_pending_filter)
         sliders_layout.addWidget(self.end_slider)
 
         time_filter_layout.addLayout(sliders_layout)
@@ -226,11 +753,7 @@ class ProcessTreeWindow(QMainWindow):
         tree_layout.addWidget(QLabel("<b>Process Tree</b>"))
         self.histogram_widget = MatplotlibWidget(on_hour_selected=self.on_hour_selected)
         self.tree_view = QTreeView()
-        self.tree_model = QStandardItemModel()
-        self.tree_model.setHorizontalHeaderLabels([
-            "Process Name", "Full Path", "Account Name", "PID",
-            "Created Time", "Command Line"
-        ])
+        self.tree_model = ProcessTreeModel()
         self.tree_view.setModel(self.tree_model)
         self.tree_delegate = HighlightDelegate(self.tree_view)
         self.tree_view.setItemDelegate(self.tree_delegate)
@@ -242,6 +765,7 @@ class ProcessTreeWindow(QMainWindow):
         self.tree_view.setColumnWidth(4, 150)
         self.tree_view.setColumnWidth(5, 500)
         self.tree_view.setWordWrap(False)
+        self.tree_view.setUniformRowHeights(True)
         self.tree_view.setMinimumHeight(200)
         self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree_view.customContextMenuRequested.connect(self.show_tree_context_menu)
@@ -322,7 +846,7 @@ class ProcessTreeWindow(QMainWindow):
 
         self.splitter.splitterMoved.connect(self.log_splitter_sizes)
 
-        self.processes = {}
+        self.set_processes_frame(EMPTY_PROCESSES_FRAME)
         self.all_usernames = set()
         self.min_time = 0
         self.max_time = 0
@@ -330,10 +854,20 @@ class ProcessTreeWindow(QMainWindow):
         self.suspicious_patterns = ['powershell', 'cmd', 'net', 'whoami', 'curl', 'wget']
         self.network_patterns = ['curl', 'wget', 'invoke-webrequest', 'invoke-restmethod', 'net use', 'ftp']
         self.registry_patterns = ['reg add', 'reg delete', 'reg import']
+        self.command_matcher = CommandPatternMatcher(
+            [self.suspicious_patterns, self.network_patterns, self.registry_patterns]
+        )
         self.flagged_paths = set()
+        self.tree_model.flagged_paths = self.flagged_paths
         self.selected_hour = None
-
-        self.lotl_binaries = [
+        self.parse_thread = None
+        self.parse_worker = None
+        self.stats_generation = 0
+        self.stats_cancelled = threading.Event()
+        self.stats_signals = FilterStatsSignals()
+        self.stats_signals.finished.connect(self.apply_filter_stats)
+
+        self.lotl_binaries = frozenset([
             'addinutil.exe', 'appinstaller.exe', 'aspnet_compiler.exe', 'at.exe', 'atbroker.exe',
             'bash.exe', 'bitsadmin.exe', 'certoc.exe', 'certreq.exe', 'certutil.exe',
             'cipher.exe', 'cmd.exe', 'cmdkey.exe', 'cmdl32.exe', 'cmstp.exe',
@@ -372,7 +906,7 @@ class ProcessTreeWindow(QMainWindow):
             'vslaunchbrowser.exe', 'vshadow.exe', 'vsjitdebugger.exe', 'wfmformat.exe', 'wfc.exe',
             'winproj.exe', 'winword.exe', 'wsl.exe', 'devtunnel.exe', 'vsls-agent.exe',
             'vstest.console.exe', 'winfile.exe', 'xsd.exe', 'powershell.exe'
-        ]
+        ])
 
     def log_splitter_sizes(self, pos, index):
         pass
@@ -386,25 +920,11 @@ class ProcessTreeWindow(QMainWindow):
         if not index.isValid():
             return
 
-        parent = index.parent()
-        row = index.row()
-        if row >= self.tree_model.rowCount(parent):
-            return
-
-        if index.column() != 0:
-            index = self.tree_model.index(row, 0, parent)
-        item = self.tree_model.itemFromIndex(index)
-        if item is None:
-            item = self.tree_model.item(row, 0) if not parent.isValid() else None
-        if item is None:
-            return
-
-        process_name = item.text()
+        process_name = index.siblingAtColumn(0).data()
         if not process_name or process_name == "Root":
             return
 
-        full_paths = set(data["full_path"] for data in self.processes.values()
-                         if data["process_name"] == process_name and data["full_path"] != "Unknown")
+        full_paths = self.tree_model.full_paths_for(process_name)
         if not full_paths:
             return
 
@@ -430,8 +950,7 @@ class ProcessTreeWindow(QMainWindow):
             return
 
         process_name = self.stats_model.item(index.row(), 0).text()
-        full_paths = set(data["full_path"] for data in self.processes.values()
-                         if data["process_name"] == process_name and data["full_path"] != "Unknown")
+        full_paths = self.tree_model.full_paths_for(process_name)
         if not full_paths:
             return
 
@@ -464,18 +983,54 @@ class ProcessTreeWindow(QMainWindow):
             self, "Select CSV File", "", "CSV Files (*.csv);;All Files (*)"
         )
         if file_path:
-            self.load_csv_data(file_path)
+            self.start_csv_parse(file_path)
+
+    def start_csv_parse(self, file_path):
+        self.browse_button.setEnabled(False)
+        self.parse_thread = QThread(self)
+        self.parse_worker = CsvParseWorker(file_path, self.lotl_binaries, self.command_matcher)
+        self.parse_worker.moveToThread(self.parse_thread)
+        self.parse_thread.started.connect(self.parse_worker.run)
+        self.parse_worker.finished.connect(self.on_csv_parsed)
+        self.parse_worker.failed.connect(self.on_csv_parse_failed)
+        self.parse_thread.start()
+
+    def finish_csv_parse(self):
+        self.parse_thread.quit()
+        self.parse_thread.wait()
+        self.parse_worker.deleteLater()
+        self.parse_thread.deleteLater()
+        self.parse_worker = None
+        self.parse_thread = None
+        self.browse_button.setEnabled(True)
+
+    def on_csv_parsed(self, parsed):
+        self.finish_csv_parse()
+        self.populate_from_parsed(parsed)
+
+    def on_csv_parse_failed(self, error):
+        self.finish_csv_parse()
+        self.show_load_error(error)
+
+    def closeEvent(self, event):
+        if self.parse_thread is not None:
+            self.parse_thread.quit()
+            self.parse_thread.wait()
+        self.cancel_filter_stats()
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(event)
 
     def resize_stats_table(self):
-        font_metrics = QFontMetrics(self.stats_table.font())
+        font = self.stats_table.font()
         max_widths = [0, 0]
+        seen = set()
         for row in range(self.stats_model.rowCount()):
             for col in range(self.stats_model.columnCount()):
                 item = self.stats_model.item(row, col)
-                if item:
+                if item and (col, item.text()) not in seen:
                     text = item.text()
-                    text_width = font_metrics.horizontalAdvance(text)
-                    max_widths[col] = max(max_widths[col], text_width)
+                    seen.add((col, text))
+                    max_widths[col] = max(max_widths[col], horizontal_advance(font, text))
         padding = 30
         max_widths = [width + padding for width in max_widths]
         max_widths[1] = max(max_widths[1], 70)
@@ -495,10 +1050,18 @@ class ProcessTreeWindow(QMainWindow):
 
     def load_csv_data(self, file_path):
         try:
-            df = pd.read_csv(file_path, encoding='utf-8', header=None, quoting=csv.QUOTE_ALL)
+            parsed = parse_event_csv(file_path, self.lotl_binaries, self.command_matcher)
+        except Exception as e:
+            self.show_load_error(e)
+            return
+        self.populate_from_parsed(parsed)
+
+    def populate_from_parsed(self, parsed):
+        self.cancel_filter_stats()
+        try:
             self.user_combo.clear()
             self.user_combo.addItem("All Users")
-            self.tree_model.removeRows(0, self.tree_model.rowCount())
+            self.tree_model.set_processes(EMPTY_PROCESSES_FRAME)
             self.stats_model.removeRows(0, self.stats_model.rowCount())
             self.unique_users_label.setText("Unique Users: 0")
             self.elevated_processes_label.setText("Elevated Processes: 0")
@@ -506,105 +1069,21 @@ class ProcessTreeWindow(QMainWindow):
             self.suspicious_commands_label.setText("Suspicious Command Lines: 0")
             self.network_commands_label.setText("Network-Related Commands: 0")
             self.registry_commands_label.setText("Registry-Related Commands: 0")
-            self.processes.clear()
             self.all_usernames.clear()
             self.flagged_paths.clear()
-            self.min_time = float('inf')
-            self.max_time = float('-inf')
-
-            message_col = None
-            for col in df.columns:
-                if df[col].astype(str).str.contains("Creator Subject", na=False).any():
-                    message_col = col
-                    break
-
-            if message_col is None:
-                raise ValueError("No column contains 'Creator Subject' (Message field).")
-
-            for idx, message in df[message_col].items():
-                if pd.isna(message) or not isinstance(message, str):
-                    continue
-                if "EventID=4688" not in message or "Creator Subject" not in message:
-                    continue
-
-                account_name_match = re.search(
-                    r"Account Name:\s+([^\n]+?)\s+Account Domain:", message, re.DOTALL
-                )
-                new_pid_match = re.search(
-                    r"New Process ID:\s+([^\n]+?)\s+New Process Name:", message, re.DOTALL
-                )
-                creator_pid_match = re.search(
-                    r"Creator Process ID:\s+([^\n]+?)\s+Creator Process Name:", message, re.DOTALL
-                )
-                process_name_match = re.search(
-                    r"New Process Name:\s+([^\n]+?)\s+Token Elevation Type:", message, re.DOTALL
-                )
-                time_match = re.search(
-                    r"TimeGenerated=(\d+)", message
-                )
-                cmdline_match = re.search(
-                    r"Process Command Line:\s+(.+?)(?=\s+Token)", message, re.DOTALL
-                )
-                elevation_match = re.search(
-                    r"Token Elevation Type:\s+(.+?)\s+Mandatory Label:", message, re.DOTALL
-                )
-                creator_name_match = re.search(
-                    r"Creator Process Name:\s+([^\n]+?)\s+Process Command Line:", message, re.DOTALL
-                )
-
-                if not all([account_name_match, new_pid_match, creator_pid_match, process_name_match]):
-                    continue
-
-                account_name = account_name_match.group(1).strip()
-                new_pid = new_pid_match.group(1).strip()
-                creator_pid = creator_pid_match.group(1).strip()
-                full_path = process_name_match.group(1).strip()
-                process_name = full_path.split('\\')[-1] if full_path else "Unknown"
-                time_generated = time_match.group(1) if time_match else "0"
-                cmdline = cmdline_match.group(1).strip().lower() if cmdline_match else "Unknown"
-                elevation_type = elevation_match.group(1).strip() if elevation_match else "Unknown"
-                creator_name = creator_name_match.group(1).strip() if creator_name_match else "Unknown"
-
-                try:
-                    time_int = int(time_generated)
-                    if time_int <= 0:
-                        time_int = 0
-                    elif time_int < 0 or time_int > 2147483647:
-                        time_int = 0
-                    else:
-                        self.min_time = min(self.min_time, time_int)
-                        self.max_time = max(self.max_time, time_int)
-                except ValueError:
-                    time_int = 0
-
-                if elevation_type not in ["TokenElevationTypeDefault (1)", "TokenElevationTypeLimited (2)",
-                                          "TokenElevationTypeFull (3)", "Unknown"]:
-                    pass
-
-                if account_name and account_name != "-":
-                    self.all_usernames.add(account_name)
-                    self.processes[new_pid] = {
-                        "account_name": account_name,
-                        "creator_pid": creator_pid,
-                        "process_name": process_name,
-                        "full_path": full_path if full_path else "Unknown",
-                        "time_generated": time_int,
-                        "cmdline": cmdline,
-                        "elevation_type": elevation_type,
-                        "creator_name": creator_name
-                    }
-
-            for pid, data in self.processes.items():
-                if data["process_name"].lower() in [bin.lower() for bin in self.lotl_binaries]:
-                    self.flagged_paths.add(data["full_path"])
+
+            self.set_processes_frame(parsed["processes_frame"])
+            self.all_usernames.update(parsed["usernames"])
+            self.flagged_paths.update(parsed["flagged_paths"])
+            self.min_time = parsed["min_time"]
+            self.max_time = parsed["max_time"]
+            self.tree_model.set_processes(self.processes_frame)
+            self.tree_view.expandAll()
 
             if self.all_usernames:
                 self.user_combo.addItems(sorted(self.all_usernames))
                 self.user_combo.setCurrentIndex(0)
 
-            if self.min_time == float('inf') or self.max_time == float('-inf'):
-                self.min_time = int(datetime(2025, 5, 14).timestamp())
-                self.max_time = int(datetime(2025, 5, 14, 23, 59, 59).timestamp())
             range_seconds = self.max_time - self.min_time
             self.slider_max = range_seconds // self.step_size if range_seconds > 0 else 100
             self.start_slider.setMaximum(self.slider_max)
@@ -618,21 +1097,26 @@ class ProcessTreeWindow(QMainWindow):
             self.filter_tree()
 
         except Exception as e:
-            self.user_combo.clear()
-            self.user_combo.addItem("All Users")
-            self.tree_model.removeRows(0, self.tree_model.rowCount())
-            self.stats_model.removeRows(0, self.stats_model.rowCount())
-            self.unique_users_label.setText("Unique Users: 0")
-            self.elevated_processes_label.setText("Elevated Processes: 0")
-            self.unique_parents_label.setText("Unique Parent Processes: 0")
-            self.suspicious_commands_label.setText("Suspicious Command Lines: 0")
-            self.network_commands_label.setText("Network-Related Commands: 0")
-            self.registry_commands_label.setText("Registry-Related Commands: 0")
-            self.start_slider.setEnabled(False)
-            self.end_slider.setEnabled(False)
-            self.start_time_label.setText("No time selected")
-            self.end_time_label.setText("No time selected")
-            QMessageBox.critical(self, "Error", f"Failed to load CSV file: {str(e)}")
+            self.show_load_error(e)
+
+    def show_load_error(self, error):
+        self.cancel_filter_stats()
+        self.set_processes_frame(EMPTY_PROCESSES_FRAME)
+        self.user_combo.clear()
+        self.user_combo.addItem("All Users")
+        self.tree_model.set_processes(EMPTY_PROCESSES_FRAME)
+        self.stats_model.removeRows(0, self.stats_model.rowCount())
+        self.unique_users_label.setText("Unique Users: 0")
+        self.elevated_processes_label.setText("Elevated Processes: 0")
+        self.unique_parents_label.setText("Unique Parent Processes: 0")
+        self.suspicious_commands_label.setText("Suspicious Command Lines: 0")
+        self.network_commands_label.setText("Network-Related Commands: 0")
+        self.registry_commands_label.setText("Registry-Related Commands: 0")
+        self.start_slider.setEnabled(False)
+        self.end_slider.setEnabled(False)
+        self.start_time_label.setText("No time selected")
+        self.end_time_label.setText("No time selected")
+        QMessageBox.critical(self, "Error", f"Failed to load CSV file: {str(error)}")
 
     def update_time_labels(self):
         start_value = self.start_slider.value()
@@ -647,84 +1131,65 @@ class ProcessTreeWindow(QMainWindow):
             end_str = "Invalid"
         self.start_time_label.setText(start_str)
         self.end_time_label.setText(end_str)
-        self.filter_tree()
+        if self.start_slider.isSliderDown() or self.end_slider.isSliderDown():
+            self.filter_timer.start()
+        else:
+            self.filter_tree()
+
+    def flush_pending_filter(self):
+        if self.filter_timer.isActive():
+            self.filter_tree()
 
     def reset_time_range(self):
         self.start_slider.setValue(0)
         self.end_slider.setValue(self.slider_max)
         self.update_time_labels()
 
+    def set_processes_frame(self, processes_frame):
+        times = processes_frame["time_generated"].to_numpy()
+        self.processes_frame = processes_frame
+        self.time_order = np.argsort(times, kind="stable")
+        self.sorted_times = times[self.time_order]
+
+    def time_window_mask(self, time_from, time_to):
+        start = np.searchsorted(self.sorted_times, time_from, side="left") if time_from else 0
+        end = np.searchsorted(self.sorted_times, time_to, side="right") if time_to else len(self.sorted_times)
+        mask = np.zeros(len(self.sorted_times), dtype=bool)
+        mask[self.time_order[start:end]] = True
+        return mask
+
     def build_process_hist(self, filter_username=None, time_from=None, time_to=None):
-        if not self.processes:
+        if self.processes_frame.empty:
             self.histogram_widget.update_plot([], [])
             return
 
-        children = {}
-        for pid, data in self.processes.items():
-            creator_pid = data["creator_pid"]
-            if creator_pid not in children:
-                children[creator_pid] = []
-            children[creator_pid].append(pid)
-
-        process_list = []
-        for pid, process_data in self.processes.items():
-            if process_data['time_generated'] <= 0:
-                continue
-            if process_data['time_generated'] > 2147483647:
-                continue
-            is_root = process_data["creator_pid"] not in self.processes
-            process_type = "Root" if is_root else f"Child of {process_data['creator_pid']}"
-            process_list.append({
-                'pid': pid,
-                'time_generated': process_data['time_generated'],
-                'account_name': process_data['account_name'],
-                'process_name': process_data['process_name'],
-                'process_type': process_type
-            })
-        if not process_list:
+        df = self.processes_frame
+        mask = self.time_window_mask(max(time_from or 1, 1), min(time_to or 2147483647, 2147483647))
+        if filter_username and filter_username != "All Users":
+            mask &= (df['account_name'] == filter_username).to_numpy()
+        df = df[mask]
+        if df.empty:
             self.histogram_widget.update_plot([], [])
             return
 
-        df = pd.DataFrame(process_list)
         try:
-            df['datetime'] = df['time_generated'].apply(lambda x: datetime.fromtimestamp(x))
-            df['hour'] = df['datetime'].dt.floor('h')
+            local_seconds = local_datetimes(df['time_generated'].to_numpy()).astype(np.int64)
         except Exception:
             self.histogram_widget.update_plot([], [])
             return
 
-        if filter_username and filter_username != "All Users":
-            df = df[df['account_name'] == filter_username]
-        if time_from:
-            df = df[df['time_generated'] >= time_from]
-        if time_to:
-            df = df[df['time_generated'] <= time_to]
-
-        if df.empty:
-            self.histogram_widget.update_plot([], [])
-            return
-
-        counts = df.groupby('hour').size()
         range_start = pd.Timestamp(datetime.fromtimestamp(time_from)).floor('h')
         range_end = pd.Timestamp(datetime.fromtimestamp(time_to)).ceil('h')
-        counts = counts.reindex(
-            pd.date_range(
-                start=range_start,
-                end=range_end,
-                freq='h'
-            ),
-            fill_value=0
-        )
+        hour_index = pd.date_range(start=range_start, end=range_end, freq='h')
+        hour_bins = (local_seconds - int(range_start.timestamp())) // 3600
+        hour_bins = hour_bins[(hour_bins >= 0) & (hour_bins < len(hour_index))]
+        count_values = np.bincount(hour_bins, minlength=len(hour_index))
 
-        min_date = counts.index.min().date()
-        max_date = counts.index.max().date()
+        min_date = hour_index.min().date()
+        max_date = hour_index.max().date()
         use_date = (max_date - min_date).days > 0
         try:
-            if use_date:
-                hours = [h.strftime('%m-%d %H:%M') for h in counts.index]
-            else:
-                hours = [h.strftime('%H:%M') for h in counts.index]
-            count_values = counts.values
+            hours = hour_index.strftime('%m-%d %H:%M' if use_date else '%H:%M').tolist()
         except Exception:
             self.histogram_widget.update_plot([], [])
             return
@@ -741,145 +1206,76 @@ class ProcessTreeWindow(QMainWindow):
         self.tree_view.viewport().update()
 
     def build_process_tree(self, filter_username=None, time_from=None, time_to=None):
-        self.tree_model.removeRows(0, self.tree_model.rowCount())
-        self.stats_model.removeRows(0, self.stats_model.rowCount())
+        df = self.processes_frame
+        mask = self.time_window_mask(time_from, time_to)
+        if filter_username:
+            mask &= (df["account_name"] == filter_username).to_numpy()
+        if self.selected_hour:
+            selected_hours = np.flatnonzero(HOUR_LABELS == self.selected_hour)
+            mask &= np.isin(df["hour_of_day"].to_numpy(), selected_hours)
+
+        self.cancel_filter_stats()
+        QThreadPool.globalInstance().start(FilterStatsWorker(
+            self.stats_signals, self.stats_generation, self.stats_cancelled,
+            df, mask, frozenset(self.flagged_paths), self.command_matcher
+        ))
+
+        current_user = self.user_combo.currentText()
+        if current_user == "All Users":
+            child_mask = np.ones(len(df), dtype=bool)
+        elif current_user in self.tree_model.account_code_by_name:
+            child_mask = self.tree_model.account_codes == self.tree_model.account_code_by_name[current_user]
+        else:
+            child_mask = np.zeros(len(df), dtype=bool)
+
+        self.tree_view.setUpdatesEnabled(False)
+        for node, hidden in self.tree_model.update_hidden(self.tree_model.hidden_nodes(mask, child_mask)):
+            parent_node = self.tree_model.node_parents[node]
+            parent_index = self.tree_model.node_index(parent_node) if parent_node >= 0 else QModelIndex()
+            row = self.tree_model.node_positions[node]
+            self.tree_view.setRowHidden(row, parent_index, hidden)
+        self.tree_view.setUpdatesEnabled(True)
+
+        self.build_process_hist(filter_username, time_from, time_to)
 
-        children = {}
-        for pid, data in self.processes.items():
-            creator_pid = data["creator_pid"]
-            if creator_pid not in children:
-                children[creator_pid] = []
-            children[creator_pid].append(pid)
-
-        total_processes = 0
-        app_counts = {}
-        unique_users = set()
-        elevated_processes = 0
-        parent_processes = set()
-        suspicious_commands = 0
-        network_commands = 0
-        registry_commands = 0
-        filtered_pids = []
-
-        root = QStandardItem("Root")
-        for pid, data in self.processes.items():
-            if filter_username and data["account_name"] != filter_username:
-                continue
-            if time_from and data["time_generated"] < time_from:
-                continue
-            if time_to and data["time_generated"] > time_to:
-                continue
-            if self.selected_hour:
-                process_time = datetime.fromtimestamp(data["time_generated"])
-                process_time_floored = process_time.replace(minute=0, second=0, microsecond=0)
-                process_hour = process_time_floored.strftime('%H:%M')
-                if process_hour != self.selected_hour:
-                    continue
-            total_processes += 1
-            app_name = data["process_name"]
-            app_counts[app_name] = app_counts.get(app_name, 0) + 1
-            unique_users.add(data["account_name"])
-            if data["elevation_type"] in ["TokenElevationTypeFull (3)", "TokenElevationTypeLimited (2)"]:
-                elevated_processes += 1
-            parent_processes.add(data["creator_name"])
-            cmdline = data["cmdline"]
-            if any(pattern in cmdline for pattern in self.suspicious_patterns):
-                suspicious_commands += 1
-            if any(pattern in cmdline for pattern in self.network_patterns):
-                network_commands += 1
-            if any(pattern in cmdline for pattern in self.registry_patterns):
-                registry_commands += 1
-            filtered_pids.append(pid)
-            if data["creator_pid"] not in self.processes:
-                self.add_process_node(root, pid, children)
+    def cancel_filter_stats(self):
+        self.stats_cancelled.set()
+        self.stats_cancelled = threading.Event()
+        self.stats_generation += 1
 
+    def apply_filter_stats(self, generation, stats):
+        if generation != self.stats_generation:
+            return
+
+        self.stats_model.removeRows(0, self.stats_model.rowCount())
         stats_rows = []
         total_item = QStandardItem("Total Processes")
-        total_count = QStandardItem(str(total_processes))
+        total_count = QStandardItem(str(stats["total_processes"]))
         total_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
         stats_rows.append([total_item, total_count])
-        if total_processes > 0:
-            sorted_apps = sorted(app_counts.items(), key=lambda x: x[0])
-            for app, count in sorted_apps:
+        if stats["total_processes"] > 0:
+            for app, count in stats["app_counts"].items():
                 app_item = QStandardItem(app)
                 count_item = QStandardItem(str(count))
                 count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                if any(data["full_path"] in self.flagged_paths for data in self.processes.values()
-                       if data["process_name"] == app):
-                    app_item.setForeground(QBrush(QColor(0, 0, 255)))
+                if app in stats["flagged_apps"]:
+                    app_item.setForeground(self.tree_model.flagged_brush)
                 stats_rows.append([app_item, count_item])
         for row in stats_rows:
             self.stats_model.appendRow(row)
 
         self.resize_stats_table()
 
-        self.unique_users_label.setText(f"Unique Users: {len(unique_users)}")
-        self.elevated_processes_label.setText(f"Elevated Processes: {elevated_processes}")
-        self.unique_parents_label.setText(f"Unique Parent Processes: {len(parent_processes)}")
-        self.suspicious_commands_label.setText(f"Suspicious Command Lines: {suspicious_commands}")
-        self.network_commands_label.setText(f"Network-Related Commands: {network_commands}")
-        self.registry_commands_label.setText(f"Registry-Related Commands: {registry_commands}")
-
-        if root.hasChildren():
-            self.tree_model.appendRow(root)
-            self.tree_view.expandAll()
-
-        self.build_process_hist(filter_username, time_from, time_to)
-
-        font_metrics = QFontMetrics(self.tree_view.font())
-        max_cmdline_width = self.tree_view.columnWidth(5)
-        for row in range(self.tree_model.rowCount()):
-            index = self.tree_model.index(row, 5)
-            item = self.tree_model.itemFromIndex(index)
-            if item:
-                text = item.text()
-                text_width = font_metrics.horizontalAdvance(text)
-                max_cmdline_width = max(max_cmdline_width, text_width + 30)
-            for child_row in range(self.tree_model.rowCount(index)):
-                child_index = self.tree_model.index(child_row, 5, index)
-                child_item = self.tree_model.itemFromIndex(child_index)
-                if child_item:
-                    text = child_item.text()
-                    text_width = font_metrics.horizontalAdvance(text)
-                    max_cmdline_width = max(max_cmdline_width, text_width + 30)
-
-        self.tree_view.setColumnWidth(5, max_cmdline_width)
-
-    def add_process_node(self, parent, pid, children):
-        data = self.processes[pid]
-        node = QStandardItem(data["process_name"])
-        full_path_item = QStandardItem(data["full_path"])
-        full_path_item.setData(data["full_path"], Qt.ToolTipRole)
-        account_item = QStandardItem(data["account_name"])
-        pid_item = QStandardItem(pid)
-        try:
-            time_str = (datetime.fromtimestamp(data["time_generated"]).strftime('%Y-%m-%d %H:%M:%S')
-                        if data["time_generated"] > 0 else "Unknown")
-        except (OSError, ValueError, TypeError):
-            time_str = "Unknown"
-        created_time_item = QStandardItem(time_str)
-        cmdline_display = data["cmdline"]
-        cmdline_item = QStandardItem(cmdline_display)
-        cmdline_item.setData(data["cmdline"], Qt.ToolTipRole)
-
-        if data["full_path"] in self.flagged_paths:
-            blue_brush = QBrush(QColor(0, 0, 255))
-            for item in [node, full_path_item, account_item, pid_item, created_time_item, cmdline_item]:
-                item.setForeground(blue_brush)
-        elif data["elevation_type"] in ["TokenElevationTypeFull (3)", "TokenElevationTypeLimited (2)"]:
-            red_brush = QBrush(QColor(200, 0, 0))
-            for item in [node, full_path_item, account_item, pid_item, created_time_item, cmdline_item]:
-                item.setForeground(red_brush)
-
-        parent.appendRow([node, full_path_item, account_item, pid_item, created_time_item, cmdline_item])
-
-        for child_pid in children.get(pid, []):
-            if (self.processes[child_pid]["account_name"] == self.user_combo.currentText() or
-                    self.user_combo.currentText() == "All Users"):
-                self.add_process_node(node, child_pid, children)
+        self.unique_users_label.setText(f"Unique Users: {stats['unique_users']}")
+        self.elevated_processes_label.setText(f"Elevated Processes: {stats['elevated_processes']}")
+        self.unique_parents_label.setText(f"Unique Parent Processes: {stats['parent_processes']}")
+        self.suspicious_commands_label.setText(f"Suspicious Command Lines: {stats['suspicious_commands']}")
+        self.network_commands_label.setText(f"Network-Related Commands: {stats['network_commands']}")
+        self.registry_commands_label.setText(f"Registry-Related Commands: {stats['registry_commands']}")
 
     def filter_tree(self, username=None):
-        if not self.processes:
+        self.filter_timer.stop()
+        if self.processes_frame.empty:
             return
 
         start_value = self.start_slider.value()
@@ -888,6 +1284,7 @@ class ProcessTreeWindow(QMainWindow):
         end_time = self.min_time + (end_value * self.step_size)
 
         if start_time > end_time:
+            self.cancel_filter_stats()
             self.stats_model.removeRows(0, self.stats_model.rowCount())
             self.stats_model.appendRow([QStandardItem("Invalid time range"), QStandardItem("")])
             self.unique_users_label.setText("Unique Users: 0")